@@ -8,19 +8,89 @@ Supports GUI interface and ADI file export
 
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
+import tkinter.font as tkfont
 from datetime import datetime, timedelta, timezone
 import json
+import csv
 import os
+import functools
+import operator
 import locale
 import re
+import queue
+import threading
 from pathlib import Path
-from languages import get_language, get_available_languages, get_language_names
+from languages import get_language, get_available_languages, get_language_names, get_language_code
+
+try:
+    # Optional: faster JSON for large log files
+    import orjson
+except ImportError:
+    orjson = None
 
 # Modern UI style configuration
 ACCENT_COLOR = "#0078d4"
 SUCCESS_COLOR = "#17a2b8"
 WARNING_COLOR = "#ff6b6b"
 
+# Combobox choices
+CQ_ZONE_VALUES = ("",) + tuple(str(i) for i in range(1, 41))
+ITU_ZONE_VALUES = ("",) + tuple(str(i) for i in range(1, 76))
+MODE_VALUES = ("SSB", "CW", "FM", "BPSK", "QPSK", "PSK31")
+
+# ADI file header, written once before the QSO records
+ADI_HEADER = (
+    "ADIF export from QO-100 Logger\n"
+    "\n"
+    "<ADIF_VER:5>3.1.0\n"
+    "<PROGRAMID:13>QO-100 Logger\n"
+    "<PROGRAMVERSION:5>1.0.0\n"
+    "<EOH>\n"
+)
+
+# Constant ADI fields written for every QSO
+SAT_NAME_TAG = "<SAT_NAME:6>QO-100"
+PROP_MODE_TAG = "<PROP_MODE:3>SAT"
+SAT_MODE_TAG = "<SAT_MODE:2>SX"
+
+# Fields of a log entry, in file/export order
+LOG_FIELDS = ("date", "time", "my_call", "other_call", "my_freq", "other_freq", 
+              "my_rst", "other_rst", "mode", "comment", "grid", "cq_zone", "itu_zone", "country")
+# Columns needed by the log list, fetched from an entry in one call
+get_log_view_fields = operator.itemgetter("date", "time", "my_call", "other_call", "mode", 
+                                          "my_freq", "other_freq")
+# All fields of an entry in LOG_FIELDS order (CSV rows, ADI records)
+get_log_row = operator.itemgetter(*LOG_FIELDS)
+
+# Rows inserted per idle callback when (re)loading the log list
+LOG_FILL_CHUNK = 200
+
+# Named Tk fonts shared by all widgets, created once in setup_modern_theme
+FONT_TITLE = "QOTitleFont"
+FONT_HEADING = "QOHeadingFont"
+FONT_DATE = "QODateFont"
+FONT_TIME = "QOTimeFont"
+FONT_LABEL = "QOLabelFont"
+FONT_BOLD = "QOBoldFont"
+FONT_BODY = "QOBodyFont"
+FONT_BODY_BOLD = "QOBodyBoldFont"
+FONT_SMALL = "QOSmallFont"
+FONT_SPECS = {
+    FONT_TITLE: (20, "bold"),
+    FONT_HEADING: (16, "bold"),
+    FONT_DATE: (12, "bold"),
+    FONT_TIME: (13, "bold"),
+    FONT_LABEL: (11, "normal"),
+    FONT_BOLD: (11, "bold"),
+    FONT_BODY: (10, "normal"),
+    FONT_BODY_BOLD: (10, "bold"),
+    FONT_SMALL: (9, "normal"),
+}
+
+# Character classes used to pick a font for mixed-script text
+_CHINESE_RE = re.compile(r'[\u4e00-\u9fff]')
+_ENGLISH_RE = re.compile(r'[a-zA-Z]')
+
 
 def get_system_language():
     """Detect system language"""
@@ -37,12 +107,68 @@ def get_system_language():
     return "en"
 
 
+def dump_log_line(log):
+    """Serialize a log entry as one UTF-8 encoded NDJSON line"""
+    if orjson is not None:
+        return orjson.dumps(log) + b"\n"
+    return json.dumps(log, ensure_ascii=False, separators=(',', ':')).encode('utf-8') + b"\n"
+
+
+def load_log_line(line):
+    """Parse one UTF-8 encoded NDJSON line into a log entry"""
+    if orjson is not None:
+        return orjson.loads(line)
+    return json.loads(line)
+
+
+def adi_tag(name, value):
+    """Format a single ADI field as <NAME:length>value"""
+    return "<" + name + ":" + str(len(value)) + ">" + value
+
+
+def try_float(text):
+    """Parse a frequency string, returning None if it is blank or not a number"""
+    # Blank fields are common and skip the exception path entirely
+    if not text:
+        return None
+    try:
+        return float(text)
+    except ValueError:
+        return None
+
+
+@functools.lru_cache(maxsize=1024)
+def get_rx_freq_adi(other_freq):
+    """Get (FREQ_RX, BAND, BAND_RX) ADI values for an RX frequency string"""
+    # QSOs share a handful of RX frequencies, so each one is parsed only once
+    freq = try_float(other_freq)
+    if freq is None:
+        return other_freq, "UNK", "13CM"
+    
+    # Band (BAND) - Determine by RX frequency
+    if 10400 <= freq <= 10500:
+        band = "13CM"
+    elif 2400 <= freq <= 2500:
+        band = "3CM"
+    else:
+        band = "UNK"
+    # RX band (BAND_RX) - based on downlink frequency (3CM if >= 10489)
+    band_rx = "3CM" if freq >= 10489 else "13CM"
+    return f"{freq:.5f}", band, band_rx
+
+
+def get_font_family(lang_code):
+    """Get the interface font family for a language"""
+    return "HuawenFangsong" if lang_code == "zh" else "Times New Roman"
+
+
+@functools.lru_cache(maxsize=2048)
 def get_font_for_text(text, lang_code="zh"):
     """Get appropriate font for text based on language and content"""
     if lang_code == "zh":
         # For Chinese interface, check if text contains Chinese characters
-        has_chinese = bool(re.search(r'[\u4e00-\u9fff]', text))
-        has_english = bool(re.search(r'[a-zA-Z]', text))
+        has_chinese = bool(_CHINESE_RE.search(text))
+        has_english = bool(_ENGLISH_RE.search(text))
         
         if has_chinese and has_english:
             # For mixed content in Chinese interface, we'll use a font that supports both
@@ -58,29 +184,32 @@ def get_font_for_text(text, lang_code="zh"):
 
 
 class SettingsDialog(tk.Toplevel):
-    """Settings dialog"""
+    """Settings dialog (built once, then shown/hidden with show())"""
     
-    def __init__(self, parent, settings, lang_dict):
+    def __init__(self, parent, lang_dict):
         super().__init__(parent)
+        # Stay hidden until show() is called
+        self.withdraw()
         self.title(lang_dict["settings"])
         self.geometry("540x580")
         self.resizable(False, False)
         self.result = None
         self.lang = lang_dict
-        
-        # Get appropriate font
-        current_lang = settings.get("language", "en")
-        font_family = "HuawenFangsong" if current_lang == "zh" else "Times New Roman"
+        self.lang_names = get_language_names()
+        # Written when the dialog is closed, show() waits on it
+        self.closed_var = tk.BooleanVar(self, value=False)
         
         # Center display
         self.transient(parent)
-        self.grab_set()
+        self.protocol("WM_DELETE_WINDOW", self.cancel)
+        # Also end a pending show() if the dialog is destroyed with the main window
+        self.bind("<Destroy>", self.on_destroy)
         
         # Create window widgets
         main_frame = ttk.Frame(self, padding="15")
         main_frame.pack(fill=tk.BOTH, expand=True)
         
-        ttk.Label(main_frame, text=lang_dict["common_settings"], font=(font_family, 16, "bold")).pack(pady=15)
+        ttk.Label(main_frame, text=lang_dict["common_settings"], style='Heading.TLabel').pack(pady=15)
         
         # Form frame
         form_frame = ttk.Frame(main_frame)
@@ -91,42 +220,39 @@ class SettingsDialog(tk.Toplevel):
         auto_detect_frame.grid(row=0, column=0, columnspan=2, sticky=tk.W, pady=10)
         ttk.Button(auto_detect_frame, text="Auto-detect System Language", 
                   command=self.auto_detect_language).pack(side=tk.LEFT, padx=5)
-        self.system_lang_label = ttk.Label(auto_detect_frame, text="", font=(font_family, 9), foreground="gray")
+        self.system_lang_label = ttk.Label(auto_detect_frame, text="", style='Hint.TLabel')
         self.system_lang_label.pack(side=tk.LEFT, padx=10)
         
         # Language selection
-        ttk.Label(form_frame, text="Language:", font=(font_family, 10)).grid(row=1, column=0, sticky=tk.W, pady=10)
-        self.lang_var = tk.StringVar(value=settings.get("language", "en"))
-        lang_names = get_language_names()
+        ttk.Label(form_frame, text="Language:").grid(row=1, column=0, sticky=tk.W, pady=10)
+        self.lang_var = tk.StringVar()
         ttk.Combobox(form_frame, textvariable=self.lang_var, 
-                     values=list(lang_names.values()), 
+                     values=list(self.lang_names.values()), 
                      width=40, state="readonly").grid(row=1, column=1, sticky=tk.EW, padx=10)
         
         # My callsign
-        ttk.Label(form_frame, text=lang_dict["my_call"], font=(font_family, 10)).grid(row=2, column=0, sticky=tk.W, pady=10)
-        self.my_call_var = tk.StringVar(value=settings.get("my_call", ""))
+        ttk.Label(form_frame, text=lang_dict["my_call"]).grid(row=2, column=0, sticky=tk.W, pady=10)
+        self.my_call_var = tk.StringVar()
         ttk.Entry(form_frame, textvariable=self.my_call_var, width=40).grid(row=2, column=1, sticky=tk.EW, padx=10)
         
         # Grid
-        ttk.Label(form_frame, text=lang_dict["my_grid"], font=(font_family, 10)).grid(row=3, column=0, sticky=tk.W, pady=10)
-        self.grid_var = tk.StringVar(value=settings.get("grid", ""))
+        ttk.Label(form_frame, text=lang_dict["my_grid"]).grid(row=3, column=0, sticky=tk.W, pady=10)
+        self.grid_var = tk.StringVar()
         ttk.Entry(form_frame, textvariable=self.grid_var, width=40).grid(row=3, column=1, sticky=tk.EW, padx=10)
         
         # CQ Zone
-        ttk.Label(form_frame, text=lang_dict["cq_zone"], font=(font_family, 10)).grid(row=4, column=0, sticky=tk.W, pady=10)
-        self.cq_var = tk.StringVar(value=settings.get("cq_zone", ""))
-        cq_values = [""] + [str(i) for i in range(1, 41)]
-        ttk.Combobox(form_frame, textvariable=self.cq_var, values=cq_values, width=38, state="readonly").grid(row=4, column=1, sticky=tk.EW, padx=10)
+        ttk.Label(form_frame, text=lang_dict["cq_zone"]).grid(row=4, column=0, sticky=tk.W, pady=10)
+        self.cq_var = tk.StringVar()
+        ttk.Combobox(form_frame, textvariable=self.cq_var, values=CQ_ZONE_VALUES, width=38, state="readonly").grid(row=4, column=1, sticky=tk.EW, padx=10)
         
         # ITU Zone
-        ttk.Label(form_frame, text=lang_dict["itu_zone"], font=(font_family, 10)).grid(row=5, column=0, sticky=tk.W, pady=10)
-        self.itu_var = tk.StringVar(value=settings.get("itu_zone", ""))
-        itu_values = [""] + [str(i) for i in range(1, 76)]
-        ttk.Combobox(form_frame, textvariable=self.itu_var, values=itu_values, width=38, state="readonly").grid(row=5, column=1, sticky=tk.EW, padx=10)
+        ttk.Label(form_frame, text=lang_dict["itu_zone"]).grid(row=5, column=0, sticky=tk.W, pady=10)
+        self.itu_var = tk.StringVar()
+        ttk.Combobox(form_frame, textvariable=self.itu_var, values=ITU_ZONE_VALUES, width=38, state="readonly").grid(row=5, column=1, sticky=tk.EW, padx=10)
         
         # Country
-        ttk.Label(form_frame, text=lang_dict["country_code"], font=(font_family, 10)).grid(row=6, column=0, sticky=tk.W, pady=10)
-        self.country_var = tk.StringVar(value=settings.get("country", ""))
+        ttk.Label(form_frame, text=lang_dict["country_code"]).grid(row=6, column=0, sticky=tk.W, pady=10)
+        self.country_var = tk.StringVar()
         ttk.Entry(form_frame, textvariable=self.country_var, width=40).grid(row=6, column=1, sticky=tk.EW, padx=10)
         
         form_frame.columnconfigure(1, weight=1)
@@ -141,27 +267,52 @@ class SettingsDialog(tk.Toplevel):
         # Show detected system language
         self.show_system_language()
     
+    def show(self, settings):
+        """Fill the form from settings, show the dialog and wait until it is closed"""
+        current_lang = settings.get("language", "en")
+        self.lang_var.set(self.lang_names.get(current_lang, current_lang))
+        self.my_call_var.set(settings.get("my_call", ""))
+        self.grid_var.set(settings.get("grid", ""))
+        self.cq_var.set(settings.get("cq_zone", ""))
+        self.itu_var.set(settings.get("itu_zone", ""))
+        self.country_var.set(settings.get("country", ""))
+        self.result = None
+        
+        self.deiconify()
+        self.grab_set()
+        self.wait_variable(self.closed_var)
+        return self.result
+    
+    def close(self):
+        """Hide the dialog so it can be shown again"""
+        self.grab_release()
+        self.withdraw()
+        self.closed_var.set(True)
+    
+    def on_destroy(self, event):
+        """Release a pending show() when the dialog is destroyed"""
+        # <Destroy> is also delivered for every child widget
+        if str(event.widget) == str(self):
+            self.closed_var.set(True)
+    
     def show_system_language(self):
         """Show detected system language"""
         system_lang = get_system_language()
-        lang_names = get_language_names()
-        lang_display = lang_names.get(system_lang, "Unknown")
+        lang_display = self.lang_names.get(system_lang, "Unknown")
         self.system_lang_label.config(text=f"Detected: {lang_display}")
     
     def auto_detect_language(self):
         """Auto-detect and set system language"""
         system_lang = get_system_language()
-        lang_names = get_language_names()
-        if system_lang in lang_names:
-            display_name = lang_names[system_lang]
+        if system_lang in self.lang_names:
+            display_name = self.lang_names[system_lang]
             self.lang_var.set(display_name)
             self.show_system_language()
     
     def save_settings(self):
         """Save settings"""
         # Get language code
-        lang_names_rev = {v: k for k, v in get_language_names().items()}
-        lang_code = lang_names_rev.get(self.lang_var.get(), "zh")
+        lang_code = get_language_code(self.lang_var.get())
         
         self.result = {
             "language": lang_code,
@@ -171,99 +322,134 @@ class SettingsDialog(tk.Toplevel):
             "itu_zone": self.itu_var.get(),
             "country": self.country_var.get().strip(),
         }
-        self.destroy()
+        self.close()
     
     def cancel(self):
         """Cancel"""
         self.result = None
-        self.destroy()
+        self.close()
 
 
 class EditLogDialog(tk.Toplevel):
-    """Edit log dialog"""
+    """Edit log dialog (built once, then shown/hidden with show())"""
     
-    def __init__(self, parent, log_entry, lang_dict):
+    def __init__(self, parent, lang_dict):
         super().__init__(parent)
-        self.title(lang_dict.get("edit_log", "Edit Log"))
+        # Stay hidden until show() is called
+        self.withdraw()
+        self.title(lang_dict["edit_log"])
         self.geometry("530x560")
         self.resizable(True, True)
         self.result = None
         self.lang = lang_dict
-        self.log_entry = log_entry.copy()
-        
-        # Get appropriate font (default to Chinese for consistency)
-        font_family = "HuawenFangsong"
+        self.log_entry = None
+        # Written when the dialog is closed, show() waits on it
+        self.closed_var = tk.BooleanVar(self, value=False)
         
         # Center display
         self.transient(parent)
-        self.grab_set()
+        self.protocol("WM_DELETE_WINDOW", self.cancel)
+        # Also end a pending show() if the dialog is destroyed with the main window
+        self.bind("<Destroy>", self.on_destroy)
         
         # Create window widgets
         main_frame = ttk.Frame(self, padding="10")
         main_frame.pack(fill=tk.BOTH, expand=True)
         
         # Date
-        ttk.Label(main_frame, text=lang_dict["date"], font=(font_family, 10)).grid(row=0, column=0, sticky=tk.W, pady=8)
-        self.date_var = tk.StringVar(value=log_entry["date"])
+        ttk.Label(main_frame, text=lang_dict["date"]).grid(row=0, column=0, sticky=tk.W, pady=8)
+        self.date_var = tk.StringVar()
         ttk.Entry(main_frame, textvariable=self.date_var, width=30).grid(row=0, column=1, sticky=tk.W, padx=5, pady=8)
         
         # Time
-        ttk.Label(main_frame, text=lang_dict["time"], font=(font_family, 10)).grid(row=1, column=0, sticky=tk.W, pady=8)
-        self.time_var = tk.StringVar(value=log_entry["time"])
+        ttk.Label(main_frame, text=lang_dict["time"]).grid(row=1, column=0, sticky=tk.W, pady=8)
+        self.time_var = tk.StringVar()
         ttk.Entry(main_frame, textvariable=self.time_var, width=30).grid(row=1, column=1, sticky=tk.W, padx=5, pady=8)
         
         # My callsign
-        ttk.Label(main_frame, text=lang_dict["my_call"], font=(font_family, 10)).grid(row=2, column=0, sticky=tk.W, pady=8)
-        self.my_call_var = tk.StringVar(value=log_entry["my_call"])
+        ttk.Label(main_frame, text=lang_dict["my_call"]).grid(row=2, column=0, sticky=tk.W, pady=8)
+        self.my_call_var = tk.StringVar()
         ttk.Entry(main_frame, textvariable=self.my_call_var, width=30).grid(row=2, column=1, sticky=tk.W, padx=5, pady=8)
         
         # Other callsign
-        ttk.Label(main_frame, text=lang_dict["other_call"], font=(font_family, 10)).grid(row=3, column=0, sticky=tk.W, pady=8)
-        self.other_call_var = tk.StringVar(value=log_entry["other_call"])
+        ttk.Label(main_frame, text=lang_dict["other_call"]).grid(row=3, column=0, sticky=tk.W, pady=8)
+        self.other_call_var = tk.StringVar()
         ttk.Entry(main_frame, textvariable=self.other_call_var, width=30).grid(row=3, column=1, sticky=tk.W, padx=5, pady=8)
         
         # TX frequency
-        ttk.Label(main_frame, text=lang_dict["up_freq"], font=(font_family, 10)).grid(row=4, column=0, sticky=tk.W, pady=8)
-        self.my_freq_var = tk.StringVar(value=log_entry["my_freq"])
+        ttk.Label(main_frame, text=lang_dict["up_freq"]).grid(row=4, column=0, sticky=tk.W, pady=8)
+        self.my_freq_var = tk.StringVar()
         ttk.Entry(main_frame, textvariable=self.my_freq_var, width=30).grid(row=4, column=1, sticky=tk.W, padx=5, pady=8)
         
         # RX frequency
-        ttk.Label(main_frame, text=lang_dict["down_freq"], font=(font_family, 10)).grid(row=5, column=0, sticky=tk.W, pady=8)
-        self.other_freq_var = tk.StringVar(value=log_entry["other_freq"])
+        ttk.Label(main_frame, text=lang_dict["down_freq"]).grid(row=5, column=0, sticky=tk.W, pady=8)
+        self.other_freq_var = tk.StringVar()
         ttk.Entry(main_frame, textvariable=self.other_freq_var, width=30).grid(row=5, column=1, sticky=tk.W, padx=5, pady=8)
         
         # Mode
-        ttk.Label(main_frame, text=lang_dict["mode"], font=(font_family, 10)).grid(row=6, column=0, sticky=tk.W, pady=8)
-        self.mode_var = tk.StringVar(value=log_entry["mode"])
+        ttk.Label(main_frame, text=lang_dict["mode"]).grid(row=6, column=0, sticky=tk.W, pady=8)
+        self.mode_var = tk.StringVar()
         ttk.Combobox(main_frame, textvariable=self.mode_var, 
-                     values=["SSB", "CW", "FM", "BPSK", "QPSK", "PSK31"],
+                     values=MODE_VALUES,
                      width=28, state="readonly").grid(row=6, column=1, sticky=tk.W, padx=5, pady=8)
         
         # My RST
-        ttk.Label(main_frame, text=lang_dict["my_rst"], font=(font_family, 10)).grid(row=7, column=0, sticky=tk.W, pady=8)
-        self.my_rst_var = tk.StringVar(value=log_entry["my_rst"])
+        ttk.Label(main_frame, text=lang_dict["my_rst"]).grid(row=7, column=0, sticky=tk.W, pady=8)
+        self.my_rst_var = tk.StringVar()
         ttk.Entry(main_frame, textvariable=self.my_rst_var, width=30).grid(row=7, column=1, sticky=tk.W, padx=5, pady=8)
         
         # Other RST
-        ttk.Label(main_frame, text=lang_dict["other_rst"], font=(font_family, 10)).grid(row=8, column=0, sticky=tk.W, pady=8)
-        self.other_rst_var = tk.StringVar(value=log_entry["other_rst"])
+        ttk.Label(main_frame, text=lang_dict["other_rst"]).grid(row=8, column=0, sticky=tk.W, pady=8)
+        self.other_rst_var = tk.StringVar()
         ttk.Entry(main_frame, textvariable=self.other_rst_var, width=30).grid(row=8, column=1, sticky=tk.W, padx=5, pady=8)
         
         # Comment
-        ttk.Label(main_frame, text=lang_dict["comment"], font=(font_family, 10), anchor=tk.NW).grid(row=9, column=0, sticky=tk.NW, pady=8)
-        self.comment_text = tk.Text(main_frame, height=3, width=32, font=(font_family, 9))
-        self.comment_text.insert("1.0", log_entry.get("comment", ""))
+        ttk.Label(main_frame, text=lang_dict["comment"], anchor=tk.NW).grid(row=9, column=0, sticky=tk.NW, pady=8)
+        self.comment_text = tk.Text(main_frame, height=3, width=32, font=FONT_SMALL)
         self.comment_text.grid(row=9, column=1, sticky=(tk.W, tk.E), padx=5, pady=8)
         
         # Button frame
         button_frame = ttk.Frame(main_frame)
         button_frame.grid(row=10, column=0, columnspan=2, pady=15)
         
-        ttk.Button(button_frame, text=lang_dict.get("save", "Save"), command=self.save_changes).pack(side=tk.LEFT, padx=10)
+        ttk.Button(button_frame, text=lang_dict["save"], command=self.save_changes).pack(side=tk.LEFT, padx=10)
         ttk.Button(button_frame, text=lang_dict["cancel"], command=self.cancel).pack(side=tk.LEFT, padx=10)
         
         main_frame.columnconfigure(1, weight=1)
     
+    def show(self, log_entry):
+        """Fill the form from a log entry, show the dialog and wait until it is closed"""
+        self.log_entry = log_entry.copy()
+        self.date_var.set(log_entry["date"])
+        self.time_var.set(log_entry["time"])
+        self.my_call_var.set(log_entry["my_call"])
+        self.other_call_var.set(log_entry["other_call"])
+        self.my_freq_var.set(log_entry["my_freq"])
+        self.other_freq_var.set(log_entry["other_freq"])
+        self.mode_var.set(log_entry["mode"])
+        self.my_rst_var.set(log_entry["my_rst"])
+        self.other_rst_var.set(log_entry["other_rst"])
+        self.comment_text.delete("1.0", tk.END)
+        self.comment_text.insert("1.0", log_entry.get("comment", ""))
+        self.result = None
+        
+        self.deiconify()
+        self.grab_set()
+        self.wait_variable(self.closed_var)
+        return self.result
+    
+    def close(self):
+        """Hide the dialog so it can be shown again"""
+        self.grab_release()
+        self.withdraw()
+        self.closed_var.set(True)
+    
+    def on_destroy(self, event):
+        """Release a pending show() when the dialog is destroyed"""
+        # <Destroy> is also delivered for every child widget
+        if str(event.widget) == str(self):
+            self.closed_var.set(True)
+    
     def save_changes(self):
         """Save changes"""
         self.log_entry["date"] = self.date_var.get()
@@ -278,12 +464,12 @@ class EditLogDialog(tk.Toplevel):
         self.log_entry["comment"] = self.comment_text.get("1.0", tk.END).strip()
         
         self.result = self.log_entry
-        self.destroy()
+        self.close()
     
     def cancel(self):
         """Cancel"""
         self.result = None
-        self.destroy()
+        self.close()
 
 
 class QO100Logger:
@@ -294,7 +480,11 @@ class QO100Logger:
         
         # Log data storage
         self.logs = []
-        self.log_file = "qo100_logs.json"
+        self.log_file = "qo100_logs.ndjson"  # One JSON object per line
+        self.legacy_log_file = "qo100_logs.json"  # Old single JSON array format
+        # False if some logs could not be loaded safely; edits and deletes (which
+        # rewrite the whole log file) are then refused for this session
+        self.logs_loaded_cleanly = True
         self.settings_file = "qo100_settings.json"
         self.settings = {}
         
@@ -310,7 +500,7 @@ class QO100Logger:
         self.lang = get_language(self.current_lang)
         
         # Set font based on language
-        self.font_family = "HuawenFangsong" if self.current_lang == "zh" else "Times New Roman"
+        self.font_family = get_font_family(self.current_lang)
         
         self.root.title(self.lang["title"])
         self.root.geometry("1200x800")
@@ -320,6 +510,30 @@ class QO100Logger:
         self.is_fullscreen = False
         self.window_geometry = None
         
+        # Pending TX frequency recalculation (debounced key presses)
+        self.up_freq_after_id = None
+        # RX frequency text the TX frequency was last calculated from
+        self.last_down_freq = ""
+        
+        # Log row currently highlighted under the mouse
+        self.hover_log_row = ""
+        
+        # Pending idle callback of an incremental log list reload
+        self.log_fill_after_id = None
+        # Log list row ids, in the same order as self.logs
+        self.log_tree_ids = []
+        
+        # Dialogs are created on first use and reused afterwards
+        self.settings_dialog = None
+        self.edit_dialog = None
+        
+        # Pending callback that clears the status bar message
+        self.status_after_id = None
+        
+        # Last date/time strings shown by the clock
+        self.last_date_str = ""
+        self.last_time_str = ""
+        
         # Bind fullscreen shortcut key (F11)
         self.root.bind("<F11>", self.toggle_fullscreen)
         # Esc to exit fullscreen
@@ -328,6 +542,18 @@ class QO100Logger:
         # Set modern theme
         self.setup_modern_theme()
         
+        # All log file writes (appends and full rewrites) happen on a background thread
+        self.log_write_queue = queue.Queue()
+        # The writer thread never calls Tk; it reports errors here for the Tk thread to show
+        self.log_write_errors = queue.Queue()
+        # Pending debounced full rewrite of the log file
+        self.save_logs_after_id = None
+        self.log_writer = threading.Thread(target=self.log_writer_loop, daemon=True)
+        self.log_writer.start()
+        self.root.after(500, self.check_log_write_errors)
+        # Flush pending writes before the window closes
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+        
         self.load_logs()
         
         # Create GUI
@@ -341,26 +567,49 @@ class QO100Logger:
         # Use system default theme, auto-adapt to dark/light
         style.theme_use('clam')
         
-        # Set font family based on language
-        font_family = "HuawenFangsong" if self.current_lang == "zh" else "Times New Roman"
+        # Create the shared named fonts once; widgets refer to them by name
+        # and pick up family changes without being re-created
+        self.fonts = [tkfont.Font(self.root, name=name, family=self.font_family, size=size, weight=weight)
+                      for name, (size, weight) in FONT_SPECS.items()]
         
         # Button style - increase width and font
         style.configure('TButton', 
-                       font=(font_family, 10),
+                       font=FONT_BODY,
                        padding=8)
         
         # Labelframe style - increase margins
-        style.configure('TLabelframe.Label', font=(font_family, 11, 'bold'))
+        style.configure('TLabelframe.Label', font=FONT_BOLD)
         style.configure('TLabelframe', padding=15)
         
+        # Label styles; plain labels use the body font
+        style.configure('TLabel', font=FONT_BODY)
+        style.configure('Title.TLabel', font=FONT_TITLE)
+        style.configure('Heading.TLabel', font=FONT_HEADING)
+        style.configure('Field.TLabel', font=FONT_LABEL)
+        style.configure('Bold.TLabel', font=FONT_BOLD)
+        style.configure('Hint.TLabel', font=FONT_SMALL, foreground="gray")
+        style.configure('Placeholder.TLabel', foreground="gray")
+        style.configure('Date.TLabel', font=FONT_DATE, foreground=ACCENT_COLOR)
+        style.configure('Time.TLabel', font=FONT_TIME, foreground=SUCCESS_COLOR)
+        style.configure('Result.TLabel', font=FONT_BOLD, foreground=SUCCESS_COLOR)
+        
         # Entry style
         style.configure('TEntry', padding=5)
         style.configure('TCombobox', padding=5)
+        
+        # Log list style
+        style.configure('Treeview', font=FONT_BODY, foreground=ACCENT_COLOR, rowheight=28)
+        style.configure('Treeview.Heading', font=FONT_BODY_BOLD)
+    
+    def set_font_family(self, font_family):
+        """Switch all shared fonts to another family; widgets update in place"""
+        self.font_family = font_family
+        for font in self.fonts:
+            font.configure(family=font_family)
     
     def create_widgets(self):
         """Create GUI interface"""
-        # Get appropriate font
-        font_family = "HuawenFangsong" if self.current_lang == "zh" else "Times New Roman"
+        lang = self.lang
         
         # Main container
         main_frame = ttk.Frame(self.root, padding="15")
@@ -370,42 +619,39 @@ class QO100Logger:
         header_frame = ttk.Frame(main_frame)
         header_frame.grid(row=0, column=0, columnspan=4, sticky=(tk.W, tk.E), pady=(0, 15))
         
-        title_label = ttk.Label(header_frame, text=self.lang["title"], 
-                               font=(font_family, 20, "bold"))
+        title_label = ttk.Label(header_frame, text=lang["title"], style='Title.TLabel')
         title_label.pack(side=tk.LEFT, fill=tk.X, expand=True)
         
         # Settings and export buttons on the right
         controls_frame = ttk.Frame(header_frame)
         controls_frame.pack(side=tk.RIGHT, padx=(10, 0))
-        ttk.Button(controls_frame, text=self.lang["settings"], 
+        ttk.Button(controls_frame, text=lang["settings"], 
                   command=self.open_settings).pack(side=tk.LEFT, padx=5)
-        ttk.Button(controls_frame, text=self.lang["export_adi"], 
+        ttk.Button(controls_frame, text=lang["export_adi"], 
                   command=self.export_adi).pack(side=tk.LEFT, padx=5)
         
         # ===== Date/Time frame =====
-        datetime_frame = ttk.LabelFrame(main_frame, text=self.lang["date_time"], padding="12")
+        datetime_frame = ttk.LabelFrame(main_frame, text=lang["date_time"], padding="12")
         datetime_frame.grid(row=1, column=0, columnspan=4, sticky=(tk.W, tk.E), pady=5)
         
         # Use grid layout to beautify date/time display
-        ttk.Label(datetime_frame, text=self.lang["utc_date"], font=(font_family, 11)).grid(row=0, column=0, sticky=tk.W, padx=(0, 15))
-        self.date_label = ttk.Label(datetime_frame, text=datetime.now(timezone.utc).strftime("%Y-%m-%d"), 
-                                   font=(font_family, 12, "bold"), foreground=ACCENT_COLOR)
+        ttk.Label(datetime_frame, text=lang["utc_date"], style='Field.TLabel').grid(row=0, column=0, sticky=tk.W, padx=(0, 15))
+        self.date_label = ttk.Label(datetime_frame, text="", style='Date.TLabel')
         self.date_label.grid(row=0, column=1, sticky=tk.W, padx=(0, 25))
         
-        ttk.Label(datetime_frame, text=self.lang["utc_time"], font=(font_family, 11)).grid(row=0, column=2, sticky=tk.W, padx=(0, 15))
-        self.time_label = ttk.Label(datetime_frame, text=datetime.now(timezone.utc).strftime("%H:%M:%S"), 
-                                   font=(font_family, 13, "bold"), foreground=SUCCESS_COLOR)
+        ttk.Label(datetime_frame, text=lang["utc_time"], style='Field.TLabel').grid(row=0, column=2, sticky=tk.W, padx=(0, 15))
+        self.time_label = ttk.Label(datetime_frame, text="", style='Time.TLabel')
         self.time_label.grid(row=0, column=3, sticky=tk.W)
         
-        # Start auto-update time
+        # Start auto-update time (fills in the labels right away)
         self.update_time()
         
         # ===== Information input frame =====
-        info_frame = ttk.LabelFrame(main_frame, text=self.lang["info_input"], padding="12")
+        info_frame = ttk.LabelFrame(main_frame, text=lang["info_input"], padding="12")
         info_frame.grid(row=2, column=0, columnspan=4, sticky=(tk.W, tk.E), pady=5)
         
         # Row 1: Callsign info
-        ttk.Label(info_frame, text=self.lang["my_call"], font=(font_family, 11, "bold")).grid(row=0, column=0, sticky=tk.W, padx=(0, 10))
+        ttk.Label(info_frame, text=lang["my_call"], style='Bold.TLabel').grid(row=0, column=0, sticky=tk.W, padx=(0, 10))
         self.my_call_var = tk.StringVar()
         my_call_entry = ttk.Entry(info_frame, textvariable=self.my_call_var, width=15, state="readonly")
         my_call_entry.grid(row=0, column=1, sticky=tk.W, padx=(0, 20))
@@ -413,56 +659,103 @@ class QO100Logger:
         if self.settings.get("my_call"):
             self.my_call_var.set(self.settings["my_call"])
         
-        ttk.Label(info_frame, text=self.lang["other_call"], font=(font_family, 11, "bold")).grid(row=0, column=2, sticky=tk.W, padx=(0, 10))
+        ttk.Label(info_frame, text=lang["other_call"], style='Bold.TLabel').grid(row=0, column=2, sticky=tk.W, padx=(0, 10))
         self.other_call_var = tk.StringVar()
         self.other_call_entry = ttk.Entry(info_frame, textvariable=self.other_call_var, width=15)
         self.other_call_entry.grid(row=0, column=3, sticky=tk.W, padx=(0, 20))
         self.other_call_entry.bind("<Return>", lambda e: self.save_log())
         
         # Row 2: Frequency info
-        ttk.Label(info_frame, text=self.lang["down_freq"], font=(font_family, 11, "bold")).grid(row=1, column=0, sticky=tk.W, padx=(0, 10), pady=(10, 0))
+        ttk.Label(info_frame, text=lang["down_freq"], style='Bold.TLabel').grid(row=1, column=0, sticky=tk.W, padx=(0, 10), pady=(10, 0))
         self.down_freq_var = tk.StringVar()
         self.down_freq_entry = ttk.Entry(info_frame, textvariable=self.down_freq_var, width=15)
         self.down_freq_entry.grid(row=1, column=1, sticky=tk.W, padx=(0, 20), pady=(10, 0))
         self.down_freq_entry.bind("<KeyRelease>", self.calculate_up_freq)
         
-        ttk.Label(info_frame, text=self.lang["up_freq"], font=(font_family, 11, "bold")).grid(row=1, column=2, sticky=tk.W, padx=(0, 10), pady=(10, 0))
+        ttk.Label(info_frame, text=lang["up_freq"], style='Bold.TLabel').grid(row=1, column=2, sticky=tk.W, padx=(0, 10), pady=(10, 0))
         self.up_freq_var = tk.StringVar()
-        self.up_freq_label = ttk.Label(info_frame, textvariable=self.up_freq_var, font=(font_family, 11, "bold"), 
-                                       foreground=SUCCESS_COLOR)
+        self.up_freq_label = ttk.Label(info_frame, textvariable=self.up_freq_var, style='Result.TLabel')
         self.up_freq_label.grid(row=1, column=3, sticky=tk.W, padx=(0, 20), pady=(10, 0))
         
         # Row 3: RST info
-        ttk.Label(info_frame, text=self.lang["my_rst"], font=(font_family, 11, "bold")).grid(row=2, column=0, sticky=tk.W, padx=(0, 10), pady=(10, 0))
+        ttk.Label(info_frame, text=lang["my_rst"], style='Bold.TLabel').grid(row=2, column=0, sticky=tk.W, padx=(0, 10), pady=(10, 0))
         self.my_rst_var = tk.StringVar(value="59")
         ttk.Entry(info_frame, textvariable=self.my_rst_var, width=15).grid(row=2, column=1, sticky=tk.W, padx=(0, 20), pady=(10, 0))
         
-        ttk.Label(info_frame, text=self.lang["other_rst"], font=(font_family, 11, "bold")).grid(row=2, column=2, sticky=tk.W, padx=(0, 10), pady=(10, 0))
+        ttk.Label(info_frame, text=lang["other_rst"], style='Bold.TLabel').grid(row=2, column=2, sticky=tk.W, padx=(0, 10), pady=(10, 0))
         self.other_rst_var = tk.StringVar(value="59")
         ttk.Entry(info_frame, textvariable=self.other_rst_var, width=15).grid(row=2, column=3, sticky=tk.W, padx=(0, 20), pady=(10, 0))
         
         # Row 4: Mode
-        ttk.Label(info_frame, text=self.lang["mode"], font=(font_family, 11, "bold")).grid(row=3, column=0, sticky=tk.W, padx=(0, 10), pady=(10, 0))
+        ttk.Label(info_frame, text=lang["mode"], style='Bold.TLabel').grid(row=3, column=0, sticky=tk.W, padx=(0, 10), pady=(10, 0))
         self.mode_var = tk.StringVar(value="SSB")
         mode_combo = ttk.Combobox(info_frame, textvariable=self.mode_var, 
-                                  values=["SSB", "CW", "FM", "BPSK", "QPSK", "PSK31"], 
+                                  values=MODE_VALUES, 
                                   width=13, state="readonly")
         mode_combo.grid(row=3, column=1, sticky=tk.W, padx=(0, 20), pady=(10, 0))
         
         # Row 5: Comment
-        ttk.Label(info_frame, text=self.lang["comment"], font=(font_family, 11, "bold"), anchor=tk.NW).grid(row=4, column=0, sticky=tk.NW, pady=(10, 0), padx=(0, 10))
+        ttk.Label(info_frame, text=lang["comment"], style='Bold.TLabel', anchor=tk.NW).grid(row=4, column=0, sticky=tk.NW, pady=(10, 0), padx=(0, 10))
         self.notes_text = tk.Text(info_frame, height=2, width=65, 
-                                 font=(font_family, 9), relief="solid", borderwidth=1)
+                                 font=FONT_SMALL, relief="solid", borderwidth=1)
         self.notes_text.grid(row=4, column=1, columnspan=3, sticky=(tk.W, tk.E), pady=(10, 0), padx=(0, 0))
         
         # ===== Log display frame =====
-        log_frame = ttk.LabelFrame(main_frame, text=f"{self.lang['logs']} (0)", padding="10")
+        log_frame = ttk.LabelFrame(main_frame, text=f"{lang['logs']} (0)", padding="10")
         log_frame.grid(row=3, column=0, columnspan=4, sticky=(tk.W, tk.E, tk.N, tk.S), pady=5)
         
         self.log_frame = log_frame
-        self.log_font_family = font_family
+        
+        # Log list: one persistent Treeview, rows are inserted/updated in place
+        columns = ("index", "date", "time", "my_call", "other_call", "mode", "freq")
+        self.log_tree = ttk.Treeview(log_frame, columns=columns, show="headings", selectmode="browse")
+        # Headings reuse the form labels without their trailing colon
+        colons = ":："
+        headings = {
+            "index": "#",
+            "date": lang["date"].rstrip(colons),
+            "time": lang["time"].rstrip(colons),
+            "my_call": lang["my_call"].rstrip(colons),
+            "other_call": lang["other_call"].rstrip(colons),
+            "mode": lang["mode"].rstrip(colons),
+            "freq": f"{lang['up_freq'].rstrip(colons)} / {lang['down_freq'].rstrip(colons)}",
+        }
+        widths = {"index": 50, "date": 100, "time": 90, "my_call": 110, 
+                  "other_call": 110, "mode": 70, "freq": 260}
+        for column in columns:
+            self.log_tree.heading(column, text=headings[column], anchor=tk.W)
+            self.log_tree.column(column, width=widths[column], anchor=tk.W, 
+                                 stretch=(column == "freq"))
+        log_scrollbar = ttk.Scrollbar(log_frame, orient=tk.VERTICAL, command=self.log_tree.yview)
+        self.log_tree.configure(yscrollcommand=log_scrollbar.set)
+        self.log_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        log_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        
+        # Right-click menu and hover highlight are bound once on the whole list
+        self.log_tree.bind("<Button-3>", self.on_log_right_click)
+        self.log_tree.tag_configure("hover", background="#e5f1fb")
+        self.log_tree.bind("<Motion>", self.on_log_hover)
+        self.log_tree.bind("<Leave>", self.on_log_hover)
+        
+        # The right-click menu is built once; it acts on self.context_log_index
+        self.context_log_index = None
+        self.log_context_menu = tk.Menu(self.root, tearoff=0)
+        self.log_context_menu.add_command(label=lang["edit_log"], 
+                                          command=lambda: self.edit_log(self.context_log_index))
+        self.log_context_menu.add_command(label=lang["delete_log"], 
+                                          command=lambda: self.delete_log(self.context_log_index))
+        
+        # Placeholder shown over the list while there are no logs
+        self.empty_log_label = ttk.Label(log_frame, text=lang["no_logs"], style='Placeholder.TLabel')
+        
         self.update_log_display()
         
+        # ===== Status bar =====
+        # Short confirmations go here instead of modal message boxes
+        self.status_var = tk.StringVar()
+        ttk.Label(main_frame, textvariable=self.status_var, style='Hint.TLabel').grid(
+            row=4, column=0, columnspan=4, sticky=tk.W, pady=(5, 0))
+        
         # Configure row/column weights
         self.root.columnconfigure(0, weight=1)
         self.root.rowconfigure(0, weight=1)
@@ -475,74 +768,92 @@ class QO100Logger:
         info_frame.columnconfigure(3, weight=1)
         
     def update_log_display(self):
-        """Update log display"""
-        # Get appropriate font
-        font_family = "HuawenFangsong" if self.current_lang == "zh" else "Times New Roman"
-        
-        # Clear old log display
-        for widget in self.log_frame.winfo_children():
-            if not isinstance(widget, ttk.Label) or not widget.cget("text").startswith(self.lang['logs']):
-                widget.destroy()
-        
-        if not self.logs:
-            empty_label = ttk.Label(self.log_frame, text=self.lang["no_logs"], 
-                                   foreground="gray", font=(font_family, 10))
-            empty_label.pack(pady=20)
-            # Update title
-            self.log_frame.config(text=f"{self.lang['logs']} (0)")
+        """Reload the whole log list"""
+        if self.log_fill_after_id is not None:
+            self.root.after_cancel(self.log_fill_after_id)
+            self.log_fill_after_id = None
+        self.log_tree.delete(*self.log_tree.get_children())
+        self.log_tree_ids = []
+        self.hover_log_row = ""
+        self.update_log_count()
+        self.fill_log_rows(0)
+    
+    def fill_log_rows(self, start):
+        """Insert the next chunk of log rows, scheduling the rest for idle time"""
+        # The first chunk covers the visible rows; the remainder is inserted
+        # in the background so a large log does not freeze the window
+        end = min(start + LOG_FILL_CHUNK, len(self.logs))
+        for i in range(start, end):
+            self.insert_log_row(i, self.logs[i])
+        if end < len(self.logs):
+            self.log_fill_after_id = self.root.after_idle(self.fill_log_rows, end)
+        else:
+            self.log_fill_after_id = None
+    
+    def log_row_values(self, index, log):
+        """Get the log list column values for a log entry"""
+        date, time, my_call, other_call, mode, my_freq, other_freq = get_log_view_fields(log)
+        return (f"#{index + 1}", date, time, my_call, other_call, mode, f"{my_freq}/{other_freq} MHz")
+    
+    def insert_log_row(self, index, log):
+        """Append a single log row to the log list"""
+        self.log_tree_ids.append(self.log_tree.insert("", tk.END, values=self.log_row_values(index, log)))
+    
+    def update_log_row(self, index):
+        """Refresh the log list row of an edited log"""
+        # Rows not inserted yet are filled from self.logs later anyway
+        if index < len(self.log_tree_ids):
+            self.log_tree.item(self.log_tree_ids[index], values=self.log_row_values(index, self.logs[index]))
+    
+    def remove_log_row(self, index):
+        """Remove the log list row of a deleted log and renumber the rows after it"""
+        if self.log_fill_after_id is not None:
+            # The pending fill still counts on the old indices
+            self.update_log_display()
             return
-        
-        # Create scrollable frame
-        canvas_frame = ttk.Frame(self.log_frame)
-        canvas_frame.pack(fill=tk.BOTH, expand=True)
-        
-        canvas = tk.Canvas(canvas_frame, highlightthickness=0)
-        scrollbar = ttk.Scrollbar(canvas_frame, orient=tk.VERTICAL, command=canvas.yview)
-        scrollable_frame = ttk.Frame(canvas)
-        
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
-        
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
-        
-        # Add log entries (right-click interactive)
-        for i, log in enumerate(self.logs):
-            log_text = f"#{i+1}  [{log['date']} {log['time']}] {log['my_call']} <-> {log['other_call']}  " \
-                      f"{log['mode']}  {log['my_freq']}/{log['other_freq']} MHz"
-            
-            # Create log item frame
-            log_item_frame = tk.Frame(scrollable_frame, relief="flat", bd=0, padx=10, pady=10)
-            log_item_frame.pack(anchor=tk.W, pady=2, fill=tk.X, padx=0)
-            
-            log_label = tk.Label(log_item_frame, text=log_text,
-                                foreground=ACCENT_COLOR, cursor="hand2", font=(font_family, 10),
-                                wraplength=700, justify=tk.LEFT)
-            log_label.pack(anchor=tk.W, fill=tk.X)
-            
-            # Bind right-click menu to each log
-            log_label.bind("<Button-3>", lambda e, idx=i: self.show_log_context_menu(e, idx))
-            log_item_frame.bind("<Button-3>", lambda e, idx=i: self.show_log_context_menu(e, idx))
-            
-            # Hover effect
-            def on_enter(e, frame=log_item_frame):
-                frame.config(relief="solid", bd=1)
-            
-            def on_leave(e, frame=log_item_frame):
-                frame.config(relief="flat", bd=0)
-            
-            log_label.bind("<Enter>", on_enter)
-            log_label.bind("<Leave>", on_leave)
-            log_item_frame.bind("<Enter>", on_enter)
-            log_item_frame.bind("<Leave>", on_leave)
-        
-        canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        
-        # Update title
+        self.log_tree.delete(self.log_tree_ids.pop(index))
+        for i in range(index, len(self.log_tree_ids)):
+            self.log_tree.set(self.log_tree_ids[i], "index", f"#{i + 1}")
+        self.update_log_count()
+    
+    def flash_status(self, message, ms=2000):
+        """Show a message in the status bar and clear it after a while"""
+        if self.status_after_id is not None:
+            self.root.after_cancel(self.status_after_id)
+        self.status_var.set(message)
+        self.status_after_id = self.root.after(ms, self.clear_status)
+    
+    def clear_status(self):
+        """Clear the status bar message"""
+        self.status_after_id = None
+        self.status_var.set("")
+    
+    def update_log_count(self):
+        """Update log count in the frame title and the empty placeholder"""
         self.log_frame.config(text=f"{self.lang['logs']} ({len(self.logs)})")
+        if self.logs:
+            self.empty_log_label.place_forget()
+        else:
+            self.empty_log_label.place(relx=0.5, rely=0.5, anchor=tk.CENTER)
+    
+    def on_log_hover(self, event):
+        """Highlight the log row under the mouse"""
+        row_id = self.log_tree.identify_row(event.y) if event.type == tk.EventType.Motion else ""
+        if row_id == self.hover_log_row:
+            return
+        if self.hover_log_row and self.log_tree.exists(self.hover_log_row):
+            self.log_tree.item(self.hover_log_row, tags=())
+        if row_id:
+            self.log_tree.item(row_id, tags=("hover",))
+        self.hover_log_row = row_id
+    
+    def on_log_right_click(self, event):
+        """Show the right-click menu for the log row under the cursor"""
+        row_id = self.log_tree.identify_row(event.y)
+        if not row_id:
+            return
+        self.log_tree.selection_set(row_id)
+        self.show_log_context_menu(event, self.log_tree.index(row_id))
         
     def save_log(self):
         """Save a log entry"""
@@ -572,9 +883,8 @@ class QO100Logger:
             return
         
         # Get current UTC time and date
-        now = datetime.now(timezone.utc)
-        current_date = now.strftime("%Y-%m-%d")
-        current_time = now.strftime("%H:%M:%S")
+        now_str = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+        current_date, current_time = now_str[:10], now_str[11:]
         
         log_entry = {
             "date": current_date,
@@ -594,16 +904,31 @@ class QO100Logger:
         }
         
         self.logs.append(log_entry)
-        self.save_logs()
-        self.update_log_display()
-        # No prompt, just clear the form
+        self.append_log(log_entry)
+        # While a reload is still filling the list it will pick up the new row
+        if self.log_fill_after_id is None:
+            self.insert_log_row(len(self.logs) - 1, log_entry)
+            self.log_tree.see(self.log_tree_ids[-1])
+        self.update_log_count()
+        # No prompt, just a status message and a cleared form
+        self.flash_status(self.lang["log_saved"])
         self.clear_form()
         
     def update_time(self):
         """Auto-update system time"""
-        now = datetime.now(timezone.utc)
-        self.date_label.config(text=now.strftime("%Y-%m-%d"))
-        self.time_label.config(text=now.strftime("%H:%M:%S"))
+        # Nothing to show while the window is minimized or hidden
+        if self.root.state() in ("iconic", "withdrawn"):
+            self.root.after(1000, self.update_time)
+            return
+        now_str = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+        date_str, time_str = now_str[:10], now_str[11:]
+        # Only touch the labels when the text actually changes
+        if date_str != self.last_date_str:
+            self.date_label.config(text=date_str)
+            self.last_date_str = date_str
+        if time_str != self.last_time_str:
+            self.time_label.config(text=time_str)
+            self.last_time_str = time_str
         # Update every 1000 milliseconds
         self.root.after(1000, self.update_time)
     
@@ -633,12 +958,13 @@ class QO100Logger:
     def open_settings(self):
         """Open settings dialog"""
         try:
-            dialog = SettingsDialog(self.root, self.settings, self.lang)
-            self.root.wait_window(dialog)
+            if self.settings_dialog is None:
+                self.settings_dialog = SettingsDialog(self.root, self.lang)
+            result = self.settings_dialog.show(self.settings)
             
-            if dialog.result:
+            if result:
                 old_lang = self.current_lang
-                self.settings = dialog.result
+                self.settings = result
                 self.save_settings()
                 
                 # Reload language
@@ -646,19 +972,41 @@ class QO100Logger:
                 if new_lang != old_lang:
                     self.current_lang = new_lang
                     self.lang = get_language(self.current_lang)
-                    # Update font family based on new language
-                    self.font_family = "HuawenFangsong" if self.current_lang == "zh" else "Times New Roman"
+                    self.set_font_family(get_font_family(self.current_lang))
+                    # Rebuild the cached dialogs in the new language on next use
+                    self.destroy_dialogs()
                     # Prompt user to restart to apply language changes
                     messagebox.showinfo(self.lang["success"], "Language switched. Please restart the application for changes to take effect")
                 
                 self.my_call_var.set(self.settings.get("my_call", ""))
-                messagebox.showinfo(self.lang["success"], self.lang["settings_saved"])
+                self.flash_status(self.lang["settings_saved"])
         except Exception as e:
             messagebox.showerror(self.lang["error"], f"{self.lang['settings_open_error']} {str(e)}")
     
+    def destroy_dialogs(self):
+        """Destroy the cached dialogs"""
+        if self.settings_dialog is not None:
+            self.settings_dialog.destroy()
+            self.settings_dialog = None
+        if self.edit_dialog is not None:
+            self.edit_dialog.destroy()
+            self.edit_dialog = None
+    
     def calculate_up_freq(self, event=None):
+        """Schedule TX frequency recalculation, coalescing bursts of key presses"""
+        if self.up_freq_after_id is not None:
+            self.root.after_cancel(self.up_freq_after_id)
+            self.up_freq_after_id = None
+        # Keys that do not change the text (arrows, Shift, ...) need no recalculation
+        if self.down_freq_var.get().strip() == self.last_down_freq:
+            return
+        self.up_freq_after_id = self.root.after(150, self.update_up_freq)
+    
+    def update_up_freq(self):
         """Calculate TX frequency from RX frequency"""
+        self.up_freq_after_id = None
         down_freq_str = self.down_freq_var.get().strip()
+        self.last_down_freq = down_freq_str
         if down_freq_str:
             try:
                 down_freq = float(down_freq_str)
@@ -683,39 +1031,48 @@ class QO100Logger:
         
     def show_log_context_menu(self, event, log_index):
         """Show log right-click menu"""
-        context_menu = tk.Menu(self.root, tearoff=0)
-        context_menu.add_command(label=self.lang.get("edit_log", "Edit"), 
-                                command=lambda: self.edit_log(log_index))
-        context_menu.add_command(label=self.lang.get("delete_log", "Delete"), 
-                                command=lambda: self.delete_log(log_index))
-        
+        self.context_log_index = log_index
         try:
-            context_menu.tk_popup(event.x_root, event.y_root)
+            self.log_context_menu.tk_popup(event.x_root, event.y_root)
         finally:
-            context_menu.grab_release()
+            self.log_context_menu.grab_release()
+    
+    def check_logs_editable(self):
+        """Return True if logs can be edited/deleted, otherwise tell the user why not"""
+        if self.logs_loaded_cleanly:
+            return True
+        # Rewriting the log file would lose the logs that could not be loaded
+        messagebox.showerror(self.lang["error"], "Some logs could not be loaded, so logs cannot be "
+                             "edited or deleted in this session (see the warning shown at startup).")
+        return False
     
     def edit_log(self, log_index):
         """Edit log"""
+        if not self.check_logs_editable():
+            return
         try:
-            dialog = EditLogDialog(self.root, self.logs[log_index], self.lang)
-            self.root.wait_window(dialog)
+            if self.edit_dialog is None:
+                self.edit_dialog = EditLogDialog(self.root, self.lang)
+            result = self.edit_dialog.show(self.logs[log_index])
             
-            if dialog.result is not None:
-                self.logs[log_index] = dialog.result
-                self.save_logs()
-                self.update_log_display()
-                messagebox.showinfo(self.lang["success"], self.lang.get("log_updated", "Log updated"))
+            if result is not None:
+                self.logs[log_index] = result
+                self.schedule_save_logs()
+                self.update_log_row(log_index)
+                self.flash_status(self.lang["log_updated"])
         except Exception as e:
-            messagebox.showerror(self.lang["error"], f"{self.lang.get('edit_failed', 'Edit failed')} {str(e)}")
+            messagebox.showerror(self.lang["error"], f"{self.lang['edit_failed']} {str(e)}")
     
     def delete_log(self, log_index):
         """Delete specified log"""
-        if messagebox.askyesno(self.lang.get("confirm", "Confirm"), self.lang.get("confirm_delete_log", "Are you sure you want to delete this log?")):
+        if not self.check_logs_editable():
+            return
+        if messagebox.askyesno(self.lang["confirm"], self.lang["confirm_delete_log"]):
             try:
                 del self.logs[log_index]
-                self.save_logs()
-                self.update_log_display()
-                messagebox.showinfo(self.lang["success"], self.lang["last_deleted"])
+                self.schedule_save_logs()
+                self.remove_log_row(log_index)
+                self.flash_status(self.lang["last_deleted"])
             except Exception as e:
                 messagebox.showerror(self.lang["error"], f"{self.lang['export_failed']} {str(e)}")
     
@@ -734,144 +1091,66 @@ class QO100Logger:
             return
         
         try:
-            adi_content = self.generate_adi()
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(adi_content)
+            # Stream the records through a 1 MiB buffer, no newline translation
+            with open(file_path, 'w', encoding='utf-8', newline='', buffering=1 << 20) as f:
+                f.writelines(self.iter_adi_lines())
             messagebox.showinfo(self.lang["success"], f"{self.lang['export_adi_success']}\n{file_path}")
         except Exception as e:
             messagebox.showerror(self.lang["error"], f"{self.lang['export_failed']} {str(e)}")
     
-    def generate_adi(self):
-        """Generate ADI format content"""
-        lines = []
-        lines.append("ADIF export from QO-100 Logger")
-        lines.append("")
-        lines.append("<ADIF_VER:5>3.1.0")
-        lines.append("<PROGRAMID:11>QO-100 Logger>")
-        lines.append("<PROGRAMVERSION:5>1.0.0>")
-        lines.append("<EOH>")
-        lines.append("")
+    def iter_adi_lines(self):
+        """Generate ADI format content piece by piece (header, then one QSO at a time)"""
+        yield ADI_HEADER
         
+        # Every record is terminated by its own <EOR>
+        format_qso_adi = self.format_qso_adi
         for log in self.logs:
-            lines.append(self.format_qso_adi(log))
-            lines.append("<EOR>")
-            lines.append("")
-        
-        return "\n".join(lines)
+            yield "\n" + format_qso_adi(log) + "\n<EOR>\n"
     
     def format_qso_adi(self, log):
         """Format single QSO as ADI format"""
-        adi_parts = []
-        
-        # My callsign (STATION_CALLSIGN)
-        my_call = log['my_call']
-        adi_parts.append(f"<STATION_CALLSIGN:{len(my_call)}>{my_call}")
-        
-        # Other callsign (CALL)
-        other_call = log['other_call']
-        adi_parts.append(f"<CALL:{len(other_call)}>{other_call}")
-        
-        # QSO date
-        date_str = log['date'].replace('-', '')
-        adi_parts.append(f"<QSO_DATE:{len(date_str)}>{date_str}")
-        
-        # QSO time ON
-        time_str = log['time'].replace(':', '')
-        adi_parts.append(f"<TIME_ON:{len(time_str)}>{time_str}")
-        
-        # QSO time OFF (same as ON)
-        adi_parts.append(f"<TIME_OFF:{len(time_str)}>{time_str}")
-        
-        # Band (BAND) - Determine by RX frequency
-        try:
-            freq = float(log['other_freq'])
-            if 10400 <= freq <= 10500:
-                band = "13CM"
-            elif 2400 <= freq <= 2500:
-                band = "3CM"
-            else:
-                band = "UNK"
-        except:
-            band = "UNK"
+        # Every field is fetched in one call instead of one dict lookup each
+        (date, time, my_call, other_call, my_freq, other_freq, my_rst, other_rst, 
+         mode, comment, grid, cq_zone, itu_zone, country) = get_log_row(log)
+        date_str = date.replace('-', '')
+        time_str = time.replace(':', '')
         
-        adi_parts.append(f"<BAND:{len(band)}>{band}")
+        # RX frequency (FREQ_RX) and the bands derived from it
+        freq_rx, band, band_rx = get_rx_freq_adi(other_freq)
         
         # Frequency (FREQ) - TX frequency
-        freq_tx = log['my_freq']
-        try:
-            freq_tx_float = float(freq_tx)
-            freq_tx_str = f"{freq_tx_float:.1f}"
-            adi_parts.append(f"<FREQ:{len(freq_tx_str)}>{freq_tx_str}")
-        except:
-            adi_parts.append(f"<FREQ:{len(freq_tx)}>{freq_tx}")
-        
-        # Comment (COMMENT) - Separate field
-        comment = log.get('comment', '')
-        if comment:
-            adi_parts.append(f"<COMMENT:{len(comment)}>{comment}")
-        
-        # RX frequency (FREQ_RX)
-        freq_rx = log['other_freq']
-        try:
-            freq_rx_float = float(freq_rx)
-            freq_rx_str = f"{freq_rx_float:.5f}"
-            adi_parts.append(f"<FREQ_RX:{len(freq_rx_str)}>{freq_rx_str}")
-        except:
-            adi_parts.append(f"<FREQ_RX:{len(freq_rx)}>{freq_rx}")
-        
-        # Mode (MODE)
-        mode = log['mode']
-        adi_parts.append(f"<MODE:{len(mode)}>{mode}")
-        
-        # Received RST (RST_RCVD)
-        rst_rcvd = log['other_rst']
-        adi_parts.append(f"<RST_RCVD:{len(rst_rcvd)}>{rst_rcvd}")
-        
-        # Sent RST (RST_SENT)
-        rst_sent = log['my_rst']
-        adi_parts.append(f"<RST_SENT:{len(rst_sent)}>{rst_sent}")
-        
-        # Satellite name
-        sat_name = "QO-100"
-        adi_parts.append(f"<SAT_NAME:{len(sat_name)}>{sat_name}")
-        
-        # Propagation mode (Satellite)
-        prop_mode = "SAT"
-        adi_parts.append(f"<PROP_MODE:{len(prop_mode)}>{prop_mode}")
-        
-        # RX band (BAND_RX) - based on downlink frequency (3CM if >= 10489)
-        try:
-            freq_rx = float(log['other_freq'])
-            band_rx = "3CM" if freq_rx >= 10489 else "13CM"
-        except:
-            band_rx = "13CM"
-        adi_parts.append(f"<BAND_RX:{len(band_rx)}>{band_rx}")
-        
-        # Satellite mode
-        sat_mode = "SX"
-        adi_parts.append(f"<SAT_MODE:{len(sat_mode)}>{sat_mode}")
-        
-        # My grid (MY_GRIDSQUARE)
-        grid = log.get('grid', '')
-        if grid:
-            adi_parts.append(f"<MY_GRIDSQUARE:{len(grid)}>{grid}")
-        
-        # CQ zone
-        cq_zone = log.get('cq_zone', '')
-        if cq_zone:
-            adi_parts.append(f"<CQZ:{len(cq_zone)}>{cq_zone}")
-        
-        # ITU zone
-        itu_zone = log.get('itu_zone', '')
-        if itu_zone:
-            adi_parts.append(f"<ITUZ:{len(itu_zone)}>{itu_zone}")
-        
-        # Country
-        country = log.get('country', '')
-        if country:
-            adi_parts.append(f"<COUNTRY:{len(country)}>{country}")
+        freq_tx = my_freq
+        freq = try_float(freq_tx)
+        if freq is not None:
+            freq_tx = f"{freq:.1f}"
+        
+        # One tuple per record; empty optional fields are None and skipped on join
+        adi_parts = (
+            adi_tag("STATION_CALLSIGN", my_call),
+            adi_tag("CALL", other_call),
+            adi_tag("QSO_DATE", date_str),
+            adi_tag("TIME_ON", time_str),
+            adi_tag("TIME_OFF", time_str),  # Same as ON
+            adi_tag("BAND", band),
+            adi_tag("FREQ", freq_tx),
+            # Comment (COMMENT) - Separate field
+            adi_tag("COMMENT", comment) if comment else None,
+            adi_tag("FREQ_RX", freq_rx),
+            adi_tag("MODE", mode),
+            adi_tag("RST_RCVD", other_rst),
+            adi_tag("RST_SENT", my_rst),
+            SAT_NAME_TAG,
+            PROP_MODE_TAG,
+            adi_tag("BAND_RX", band_rx),
+            SAT_MODE_TAG,
+            # Optional station fields
+            adi_tag("MY_GRIDSQUARE", grid) if grid else None,
+            adi_tag("CQZ", cq_zone) if cq_zone else None,
+            adi_tag("ITUZ", itu_zone) if itu_zone else None,
+            adi_tag("COUNTRY", country) if country else None,
+        )
         
-        return "\n".join(adi_parts)
+        return "\n".join(filter(None, adi_parts))
     
     def export_csv(self):
         """Export as CSV format"""
@@ -888,54 +1167,222 @@ class QO100Logger:
             return
         
         try:
-            with open(file_path, 'w', encoding='utf-8') as f:
+            # csv.writer takes care of quoting commas, quotes and newlines in any field
+            with open(file_path, 'w', encoding='utf-8', newline='', buffering=1 << 20) as f:
+                writer = csv.writer(f)
                 # Header
-                headers = ["Date", "Time", "My Callsign", "Other Callsign", "TX Frequency", "RX Frequency", 
-                          "My RST", "Other RST", "Mode", "Comment", "Grid", "CQ Zone", "ITU Zone", "Country"]
-                f.write(",".join(headers) + "\n")
+                writer.writerow(["Date", "Time", "My Callsign", "Other Callsign", "TX Frequency", "RX Frequency", 
+                                 "My RST", "Other RST", "Mode", "Comment", "Grid", "CQ Zone", "ITU Zone", "Country"])
                 
-                # Data
-                for log in self.logs:
-                    values = [
-                        log['date'],
-                        log['time'],
-                        log['my_call'],
-                        log['other_call'],
-                        log['my_freq'],
-                        log['other_freq'],
-                        log['my_rst'],
-                        log['other_rst'],
-                        log['mode'],
-                        f'"{log.get("comment", "")}"',
-                        log.get('grid', ''),
-                        log.get('cq_zone', ''),
-                        log.get('itu_zone', ''),
-                        log.get('country', '')
-                    ]
-                    f.write(",".join(values) + "\n")
+                # Data (entries are normalized to have every field in load_logs)
+                writer.writerows(map(get_log_row, self.logs))
             
             messagebox.showinfo("Success", f"CSV file exported:\n{file_path}")
         except Exception as e:
             messagebox.showerror("Error", f"Export failed: {str(e)}")
     
+    def schedule_save_logs(self):
+        """Rewrite the log file shortly; rapid edits/deletes collapse into one write"""
+        if self.save_logs_after_id is None:
+            self.save_logs_after_id = self.root.after(500, self.save_logs)
+    
     def save_logs(self):
-        """Save logs to JSON file"""
+        """Queue a rewrite of the whole log file with the current logs"""
+        if self.save_logs_after_id is not None:
+            self.root.after_cancel(self.save_logs_after_id)
+            self.save_logs_after_id = None
+        # Entries are replaced rather than modified, so a shallow copy is a stable snapshot
+        self.log_write_queue.put(list(self.logs))
+    
+    def append_log(self, log_entry):
+        """Queue a single log entry to be appended to the log file"""
+        self.log_write_queue.put(dump_log_line(log_entry))
+    
+    def log_writer_loop(self):
+        """Background thread: write queued items to the log file
+        
+        Items are bytes (a line to append), a list (a snapshot of all logs to
+        rewrite the file with) or None (stop).
+        """
+        while True:
+            items = [self.log_write_queue.get()]
+            # Whatever else is already queued goes into the same write
+            while True:
+                try:
+                    items.append(self.log_write_queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            stop = None in items
+            try:
+                self.write_log_items([item for item in items if item is not None])
+            except Exception as e:
+                # Keep the thread alive so later writes are not queued into nothing
+                self.log_write_errors.put(f"Save failed: {str(e)}")
+            
+            if stop:
+                return
+    
+    def write_log_items(self, items):
+        """Write a batch of queued rewrites/appends (runs on the writer thread)"""
+        # Only the newest rewrite matters; appends queued after it still follow
+        rewrites = [i for i, item in enumerate(items) if isinstance(item, list)]
+        if rewrites:
+            self.write_logs_file(items[rewrites[-1]])
+            items = items[rewrites[-1] + 1:]
+        
+        data = b"".join(items)
+        if data:
+            try:
+                with open(self.log_file, 'ab', buffering=1 << 16) as f:
+                    f.write(data)
+            except Exception as e:
+                self.log_write_errors.put(f"Save failed: {str(e)}")
+    
+    def write_logs_file(self, logs):
+        """Rewrite the whole log file; returns True if it was written"""
+        # Runs on the writer thread, except for the one-time legacy migration at startup
+        # Write NDJSON to a temp file, flush it to disk, then atomically replace the log file
+        tmp_file = self.log_file + ".tmp"
         try:
-            with open(self.log_file, 'w', encoding='utf-8') as f:
-                json.dump(self.logs, f, ensure_ascii=False, indent=2)
+            data = b"".join(map(dump_log_line, logs))
+            with open(tmp_file, 'wb', buffering=1 << 20) as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self.log_file)
         except Exception as e:
-            messagebox.showerror("Error", f"Save failed: {str(e)}")
+            self.log_write_errors.put(f"Save failed: {str(e)}")
+            return False
+        return True
+    
+    def check_log_write_errors(self):
+        """Periodically show errors reported by the writer thread"""
+        self.show_log_write_errors()
+        self.root.after(500, self.check_log_write_errors)
+    
+    def show_log_write_errors(self):
+        """Show all pending writer thread errors in one message box"""
+        messages = []
+        while True:
+            try:
+                messages.append(self.log_write_errors.get_nowait())
+            except queue.Empty:
+                break
+        if messages:
+            messagebox.showerror("Error", "\n".join(messages))
+    
+    def on_close(self):
+        """Finish pending log writes and close the application"""
+        if self.save_logs_after_id is not None:
+            self.save_logs()
+        self.log_write_queue.put(None)
+        self.log_writer.join(timeout=5)
+        # Errors from the final writes would otherwise be lost with the window
+        self.show_log_write_errors()
+        self.root.destroy()
     
     def load_logs(self):
-        """Load logs from JSON file"""
+        """Load logs from NDJSON file, importing the old JSON file if it is still there"""
         if os.path.exists(self.log_file):
-            try:
-                with open(self.log_file, 'r', encoding='utf-8') as f:
-                    self.logs = json.load(f)
-            except:
-                self.logs = []
+            self.load_ndjson_logs()
         else:
             self.logs = []
+        
+        # The old JSON array file is renamed once its entries are in the NDJSON file,
+        # so while it exists the migration is retried on every start
+        legacy_logs = None
+        if os.path.exists(self.legacy_log_file):
+            legacy_logs = self.load_legacy_logs()
+            if legacy_logs is not None:
+                self.logs = legacy_logs + self.logs
+        
+        # Make sure every entry has every field so columns can be read directly
+        for log in self.logs:
+            for field in LOG_FIELDS:
+                log.setdefault(field, "")
+        
+        if legacy_logs is not None:
+            self.finish_legacy_migration()
+    
+    def load_ndjson_logs(self):
+        """Load logs from the NDJSON file, skipping lines that cannot be parsed"""
+        try:
+            # Read raw bytes in one go; both parsers take UTF-8 bytes directly
+            with open(self.log_file, 'rb') as f:
+                data = f.read()
+        except OSError as e:
+            self.logs = []
+            self.logs_loaded_cleanly = False
+            self.root.after_idle(messagebox.showerror, "Error", f"Could not read {self.log_file}: {str(e)}")
+            return
+        
+        # One bad line (e.g. torn by a crash during an append) must not cost the whole logbook
+        self.logs = []
+        bad_lines = 0
+        for line in data.splitlines():
+            if not line.strip():
+                continue
+            try:
+                log = load_log_line(line)
+            except ValueError:  # Invalid JSON or UTF-8
+                bad_lines += 1
+                continue
+            if isinstance(log, dict):
+                self.logs.append(log)
+            else:
+                bad_lines += 1
+        
+        # Make the next append start on its own line after a torn last line
+        if data and not data.endswith(b"\n"):
+            self.log_write_queue.put(b"\n")
+        
+        if bad_lines:
+            # Keep the unreadable lines in a copy that is never overwritten ('x' mode);
+            # with that copy in place the log file may be rewritten without them
+            backup_file = f"{self.log_file}.{datetime.now().strftime('%Y%m%d-%H%M%S')}.bad"
+            try:
+                with open(backup_file, 'xb') as f:
+                    f.write(data)
+            except OSError as e:
+                self.logs_loaded_cleanly = False
+                note = (f"Could not save a copy of the file ({str(e)}), so edits and deletions "
+                        "are disabled to keep the unreadable lines.")
+            else:
+                note = f"A copy of the original file was saved as {backup_file}."
+            self.root.after_idle(messagebox.showwarning, "Warning",
+                                 f"{bad_lines} unreadable line(s) in {self.log_file} were skipped.\n{note}")
+    
+    def load_legacy_logs(self):
+        """Read the old JSON array log file, returning None if it cannot be read"""
+        try:
+            with open(self.legacy_log_file, 'r', encoding='utf-8') as f:
+                logs = json.load(f)
+            if not isinstance(logs, list) or not all(isinstance(log, dict) for log in logs):
+                raise ValueError("not a list of log entries")
+        except (OSError, ValueError) as e:
+            self.logs_loaded_cleanly = False
+            self.root.after_idle(
+                messagebox.showwarning, "Warning",
+                f"Could not read the old log file {self.legacy_log_file}: {str(e)}\n"
+                "Its logs are not shown and will be imported on the next start. "
+                "New logs are still saved, but edits and deletions are disabled until then.")
+            return None
+        return logs
+    
+    def finish_legacy_migration(self):
+        """Write the imported logs to the NDJSON file and retire the old JSON file"""
+        # Written right away (not queued) so the old file is only renamed once its logs are on disk
+        if not self.write_logs_file(self.logs):
+            # The old file stays, so a rewrite now would import its logs twice next time
+            self.logs_loaded_cleanly = False
+            return
+        try:
+            # Kept as a backup under a name that is not imported again
+            os.replace(self.legacy_log_file, self.legacy_log_file + ".migrated")
+        except OSError as e:
+            self.log_write_errors.put(f"Could not rename {self.legacy_log_file}: {str(e)}\n"
+                                      "Remove it before the next start or its logs are imported twice.")
     
     def save_settings(self):
         """Save settings to JSON file"""
@@ -951,7 +1398,7 @@ class QO100Logger:
             try:
                 with open(self.settings_file, 'r', encoding='utf-8') as f:
                     self.settings = json.load(f)
-            except:
+            except (OSError, ValueError):
                 self.settings = {}
         else:
             self.settings = {}
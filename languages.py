@@ -4,6 +4,8 @@ QO-100 Satellite Log Recording Software - Language Library
 Supports multiple languages
 """
 
+import functools
+
 LANGUAGES = {
     "zh": {
         "title": "QO-100 日志记录软件 V1.0",
@@ -56,6 +58,7 @@ LANGUAGES = {
         "edit_log": "编辑",
         "select_log_to_delete": "选择要删除的日志",
         "log_updated": "日志已更新",
+        "log_saved": "日志已保存",
         "edit_failed": "编辑失败",
         "confirm_delete_log": "确定要删除这条日志吗？",
     },
@@ -110,6 +113,7 @@ LANGUAGES = {
         "edit_log": "Edit",
         "select_log_to_delete": "Select log to delete",
         "log_updated": "Log updated",
+        "log_saved": "Log saved",
         "edit_failed": "Edit failed",
         "confirm_delete_log": "Are you sure you want to delete this log?",
     },
@@ -164,6 +168,7 @@ LANGUAGES = {
         "edit_log": "Editar",
         "select_log_to_delete": "Seleccionar registro para eliminar",
         "log_updated": "Registro actualizado",
+        "log_saved": "Registro guardado",
         "edit_failed": "Edición fallida",
         "confirm_delete_log": "¿Está seguro de que desea eliminar este registro?",
     },
@@ -218,6 +223,7 @@ LANGUAGES = {
         "edit_log": "Bearbeiten",
         "select_log_to_delete": "Zu löschendes Protokoll auswählen",
         "log_updated": "Protokoll aktualisiert",
+        "log_saved": "Protokoll gespeichert",
         "edit_failed": "Bearbeitung fehlgeschlagen",
         "confirm_delete_log": "Sind Sie sicher, dass Sie dieses Protokoll löschen möchten?",
     },
@@ -272,6 +278,7 @@ LANGUAGES = {
         "edit_log": "編集",
         "select_log_to_delete": "削除するログを選択",
         "log_updated": "ログが更新されました",
+        "log_saved": "ログが保存されました",
         "edit_failed": "編集に失敗しました",
         "confirm_delete_log": "このログを削除してもよろしいですか？",
     },
@@ -326,6 +333,7 @@ LANGUAGES = {
         "edit_log": "Modifier",
         "select_log_to_delete": "Sélectionner le journal à supprimer",
         "log_updated": "Journal mis à jour",
+        "log_saved": "Journal enregistré",
         "edit_failed": "Modification échouée",
         "confirm_delete_log": "Êtes-vous sûr de vouloir supprimer ce journal?",
     },
@@ -380,6 +388,7 @@ LANGUAGES = {
         "edit_log": "Editar",
         "select_log_to_delete": "Selecione o registro para excluir",
         "log_updated": "Registro atualizado",
+        "log_saved": "Registro salvo",
         "edit_failed": "Falha na edição",
         "confirm_delete_log": "Tem certeza de que deseja excluir este registro?",
     },
@@ -434,6 +443,7 @@ LANGUAGES = {
         "edit_log": "Επεξεργασία",
         "select_log_to_delete": "Επιλέξτε αρχείο για διαγραφή",
         "log_updated": "Αρχείο ενημερώθηκε",
+        "log_saved": "Αρχείο αποθηκεύτηκε",
         "edit_failed": "Επεξεργασία απέτυχε",
         "confirm_delete_log": "Είστε σίγουρος ότι θέλετε να διαγράψετε αυτό το αρχείο;",
     },
@@ -488,19 +498,23 @@ LANGUAGES = {
         "edit_log": "تعديل",
         "select_log_to_delete": "اختر السجل للحذف",
         "log_updated": "تم تحديث السجل",
+        "log_saved": "تم حفظ السجل",
         "edit_failed": "فشل التعديل",
         "confirm_delete_log": "هل أنت متأكد من رغبتك في حذف هذا السجل؟",
     }
 }
 
+@functools.lru_cache(maxsize=None)
 def get_language(lang_code="zh"):
     """Get the text library for the specified language"""
     return LANGUAGES.get(lang_code, LANGUAGES["en"])
 
+@functools.lru_cache(maxsize=None)
 def get_available_languages():
-    """Get the list of available languages"""
-    return list(LANGUAGES.keys())
+    """Get the tuple of available languages"""
+    return tuple(LANGUAGES.keys())
 
+@functools.lru_cache(maxsize=None)
 def get_language_names():
     """Get language name mapping"""
     return {
@@ -514,3 +528,10 @@ def get_language_names():
         "el": "Ελληνικά (Greek)",
         "ar": "العربية (Arabic)"
     }
+
+# Reverse of get_language_names(), built once at import time
+_LANGUAGE_CODES = {name: code for code, name in get_language_names().items()}
+
+def get_language_code(display_name):
+    """Get the language code for a language display name"""
+    return _LANGUAGE_CODES.get(display_name, "zh")